@@ -6,13 +6,39 @@ This script provides a menu to run different examples from the project.
 
 import os
 import sys
+import asyncio
+import functools
 import importlib
-from typing import Dict, Callable, Any, List
+import inspect
+from typing import Dict, Callable, Any, List, Optional
+
+
+def _enable_vt() -> bool:
+    """
+    Enable ANSI escape processing and report whether it is usable.
+
+    Returns:
+        True if the terminal understands ANSI escape sequences.
+    """
+    if os.name != 'nt':
+        return True
+    # An empty os.system call nudges Windows 10+ consoles into VT mode
+    os.system('')
+    return sys.getwindowsversion().build >= 10586
+
+
+# Decided once at import; redraws should not probe the console each time
+_USE_ANSI = _enable_vt()
 
 
 def clear_screen() -> None:
     """Clear the terminal screen."""
-    os.system('cls' if os.name == 'nt' else 'clear')
+    if _USE_ANSI:
+        # One buffered write instead of forking a shell per menu redraw
+        sys.stdout.write("\x1b[2J\x1b[H")
+        sys.stdout.flush()
+    else:
+        os.system('cls')
 
 
 def print_header(title: str) -> None:
@@ -27,6 +53,11 @@ def print_header(title: str) -> None:
     print("=" * 80 + "\n")
 
 
+# Rendered menus keyed by their options; the menu never changes between
+# loop iterations, so each redraw reuses the pre-joined string
+_MENU_CACHE: Dict[tuple, str] = {}
+
+
 def print_menu(options: Dict[str, str]) -> None:
     """
     Print a menu with the given options.
@@ -34,26 +65,80 @@ def print_menu(options: Dict[str, str]) -> None:
     Args:
         options: Dictionary mapping option keys to descriptions.
     """
-    print("\nPlease select an option:")
-    for key, description in options.items():
-        print(f"  {key}) {description}")
-    print("  q) Quit")
+    cache_key = tuple(options.items())
+    menu = _MENU_CACHE.get(cache_key)
+    
+    if menu is None:
+        lines = ["\nPlease select an option:"]
+        lines.extend(f"  {key}) {description}" for key, description in options.items())
+        lines.append("  q) Quit")
+        menu = "\n".join(lines) + "\n"
+        _MENU_CACHE[cache_key] = menu
+    
+    # One write emits the whole menu instead of a print (and a stdout
+    # lock acquisition) per line
+    sys.stdout.write(menu)
+
+
+def _cached_import(module_path: str):
+    """
+    Import a module, taking the fast path when it is already loaded.
+
+    A sys.modules hit skips importlib's _find_and_load machinery (and
+    its locking) entirely; only the first use of an example pays the
+    real import cost.
 
+    Args:
+        module_path: Dot-separated path to the module.
 
-def run_module(module_path: str) -> None:
+    Returns:
+        The imported module.
+    """
+    module = sys.modules.get(module_path)
+    if module is None:
+        module = importlib.import_module(module_path)
+    return module
+
+
+@functools.lru_cache(maxsize=32)
+def _resolve_run_demo(module_path: str) -> Optional[Callable[[], None]]:
+    """
+    Resolve a module's run_demo entry point, caching the callable.
+
+    Repeated menu selections of the same example skip both the import
+    lookup and the getattr; failed imports are not cached, so the error
+    still surfaces on every attempt.
+
+    Args:
+        module_path: Dot-separated path to the module.
+
+    Returns:
+        The module's run_demo function, or None if it has none.
+    """
+    return getattr(_cached_import(module_path), 'run_demo', None)
+
+
+def run_module(module_path: str, pause: bool = True) -> None:
     """
     Import and run a module.
     
     Args:
         module_path: Dot-separated path to the module.
+        pause: Whether to wait for Enter after the module finishes.
     """
     try:
-        # Import the module
-        module = importlib.import_module(module_path)
+        # Resolve the entry point (cached after the first selection)
+        run_demo = _resolve_run_demo(module_path)
         
-        # Look for a run_demo function
-        if hasattr(module, 'run_demo'):
-            module.run_demo()
+        if run_demo is not None:
+            if inspect.iscoroutinefunction(run_demo):
+                # The asyncio examples define async run_demo; calling it
+                # bare would just create (and discard) a coroutine. Each
+                # caller thread gets its own event loop, so this also
+                # composes with the to_thread fan-out in _run_all_async.
+                asyncio.run(run_demo())
+            else:
+                run_demo()
         else:
             print(f"Module {module_path} does not have a run_demo function.")
     except ImportError as e:
@@ -61,7 +146,31 @@ def run_module(module_path: str) -> None:
     except Exception as e:
         print(f"Error running module {module_path}: {e}")
     
-    input("\nPress Enter to continue...")
+    if pause:
+        input("\nPress Enter to continue...")
+
+
+async def _run_all_async(examples: Dict[str, Dict[str, str]]) -> None:
+    """
+    Run every example concurrently on one event loop.
+
+    The examples are mostly I/O-bound (sleeps, pipe and queue waits), so
+    dispatching each run_demo through asyncio.to_thread overlaps their
+    idle time: "run all" takes roughly as long as the slowest example
+    rather than the sum of all of them.
+
+    Args:
+        examples: Registry of examples keyed by menu option.
+    """
+    # Eager tasks (3.12+) skip scheduling overhead for fast examples
+    if hasattr(asyncio, "eager_task_factory"):
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+
+    tasks = [
+        asyncio.create_task(asyncio.to_thread(run_module, example["module"], False))
+        for example in examples.values()
+    ]
+    await asyncio.gather(*tasks)
 
 
 def main() -> None:
@@ -143,10 +252,12 @@ def main() -> None:
             print("\nExiting. Goodbye!")
             break
         elif choice == 'a':
-            print("\nRunning all examples...")
-            for key, example in examples.items():
-                print_header(f"Running {example['name']}")
-                run_module(example["module"])
+            print("\nRunning all examples concurrently...")
+            # run_module catches errors per example, so one failing demo
+            # (e.g. a module that re-sets the multiprocessing start
+            # method) does not take down the batch
+            asyncio.run(_run_all_async(examples))
+            input("\nPress Enter to continue...")
         elif choice in examples:
             example = examples[choice]
             print_header(f"Running {example['name']}")
@@ -5,85 +5,397 @@ This module demonstrates how to use process pools for parallel execution in Pyth
 """
 
 import multiprocessing as mp
+import multiprocessing.pool
+from multiprocessing import shared_memory
+import contextlib
+import itertools
+import queue
+import threading
 import time
 import random
 import os
 import sys
 import math
 from typing import List, Dict, Any, Optional, Tuple, Callable
-from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, wait, FIRST_COMPLETED
 
+import numpy as np
 
-def basic_pool_example() -> None:
+# Worker count decided once at import: os.cpu_count() returns a cached
+# int, while calling mp.cpu_count() in every example re-validates it per
+# call. Capped at 4 so the demos behave the same on large machines.
+_NPROC = min(4, os.cpu_count() or 1)
+
+
+def _pool_cm(pool: Optional[mp.pool.Pool]):
+    """
+    Yield the caller's pool, or create a short-lived one.
+
+    Every example used to build its own mp.Pool, paying process startup
+    (an interpreter boot plus module re-import under spawn) once per
+    demo. run_demo now owns one persistent pool and threads it through;
+    a fresh pool is only created when an example runs standalone.
+
+    Args:
+        pool: Pool shared by the caller, or None.
+
+    Returns:
+        A context manager yielding a usable pool.
+    """
+    if pool is not None:
+        # Do not tear down the caller's pool on exit
+        return contextlib.nullcontext(pool)
+    return mp.Pool(processes=_NPROC)
+
+
+# Worker functions live at module scope: Pool.map has to pickle its
+# callable into the task queue, which local closures cannot satisfy at
+# all, and a top-level function pickles as just its qualified name.
+
+
+def _dynamic_map(pool: mp.pool.Pool, fn: Callable, iterable) -> list:
+    """
+    Map with fully dynamic dispatch: each worker pulls one task at a time.
+
+    With chunksize=1, imap_unordered approximates work stealing through
+    the pool's shared task queue — a worker that finishes early simply
+    pulls the next task, so one straggler cannot leave siblings idle
+    behind a pre-assigned batch. The tradeoff: one IPC round-trip per
+    task, so for uniform task costs a larger chunksize is cheaper.
+
+    Args:
+        pool: Pool to dispatch on.
+        fn: Worker function.
+        iterable: Task inputs.
+
+    Returns:
+        Results in completion order.
+    """
+    return list(pool.imap_unordered(fn, iterable, chunksize=1))
+
+
+def _noop(_: int) -> None:
+    """Warm-up task: forces each worker to finish booting and importing."""
+    return None
+
+
+def _spin(x: int) -> int:
+    """
+    Burn a fixed slice of CPU with a deterministic hash loop.
+
+    Replaces the old time.sleep(random.uniform(...)) "work": sleeping
+    makes every timing converge to max(sleep)/nproc regardless of the
+    pool, while a compute kernel scales with task count, so measured
+    speedups reflect real parallelism.
+
+    Args:
+        x: Input value mixed into the hash.
+
+    Returns:
+        The final hash value.
+    """
+    h = 0
+    for _ in range(50_000):
+        h = (h * 1315423911 + x) & 0xFFFFFFFF
+    return h
+
+
+def _square_worker(x: int) -> Tuple[int, int, float]:
+    """
+    Square a value in a pool worker.
+
+    Args:
+        x: Input value.
+
+    Returns:
+        Tuple containing (input value, process ID, result).
+    """
+    # Deterministic CPU-bound work in place of a simulated delay
+    result = x * x
+    _spin(x)
+
+    return (x, os.getpid(), result)
+
+
+def _cube_worker(x: int) -> Tuple[int, int, float]:
+    """
+    Cube a value in a pool worker.
+
+    Args:
+        x: Input value.
+
+    Returns:
+        Tuple containing (input value, process ID, result).
+    """
+    # Deterministic CPU-bound work in place of a simulated delay
+    result = x * x * x
+    _spin(x)
+
+    return (x, os.getpid(), result)
+
+
+def _pow_worker(x: int, y: int) -> Tuple[int, int, int, float]:
+    """
+    Raise x to the power y in a pool worker.
+
+    Args:
+        x: First input value.
+        y: Second input value.
+
+    Returns:
+        Tuple containing (first input, second input, process ID, result).
+    """
+    # Deterministic CPU-bound work in place of a simulated delay
+    result = x ** y
+    _spin(x)
+
+    return (x, y, os.getpid(), result)
+
+
+# Read-only constant shipped once per worker by _set_const; workers read
+# it instead of receiving it pickled inside every task payload
+_CONST: Optional[int] = None
+
+
+def _set_const(value: int) -> None:
+    """
+    Store a constant in the worker process (pool initializer).
+
+    Args:
+        value: Constant to make available to every task.
+    """
+    global _CONST
+    _CONST = value
+
+
+def _pow_const(x: int) -> Tuple[int, int, int, float]:
+    """
+    Raise x to the process-global constant exponent.
+
+    Args:
+        x: Input value.
+
+    Returns:
+        Tuple containing (input, exponent, process ID, result).
+    """
+    # Deterministic CPU-bound work in place of a simulated delay
+    result = x ** _CONST
+    _spin(x)
+
+    return (x, _CONST, os.getpid(), result)
+
+
+def _pow_batch(pairs: List[Tuple[int, int]]) -> List[Tuple[int, int, int, int]]:
+    """
+    Compute x**y for a whole batch of argument pairs in one task.
+
+    Packing many tiny inputs into one payload amortizes the per-task
+    pickle round-trip, which for work this small costs far more than
+    the computation itself.
+
+    Args:
+        pairs: Batch of (base, exponent) tuples.
+
+    Returns:
+        List of (base, exponent, process ID, result) tuples.
+    """
+    pid = os.getpid()
+    return [(x, y, pid, x ** y) for x, y in pairs]
+
+
+def _error_worker(x: int) -> int:
+    """Worker that raises an error, for the error-callback demo."""
+    time.sleep(0.2)
+    raise ValueError(f"Deliberate error for input {x}")
+
+
+def _is_prime(n: int) -> Tuple[int, bool]:
+    """
+    Check if a number is prime.
+
+    Args:
+        n: Number to check.
+
+    Returns:
+        Tuple containing (number, is_prime).
+    """
+    if n <= 1:
+        return (n, False)
+    if n <= 3:
+        return (n, True)
+    if n % 2 == 0 or n % 3 == 0:
+        return (n, False)
+
+    i = 5
+    while i * i <= n:
+        if n % i == 0 or n % (i + 2) == 0:
+            return (n, False)
+        i += 6
+
+    return (n, True)
+
+
+# Shared input block for the shared-memory variant of the CPU-bound
+# demo; each pool worker attaches once in its initializer and tasks then
+# carry only (start, end) index pairs instead of pickled numbers
+_shm_numbers: Optional[np.ndarray] = None
+_shm_handle: Optional[shared_memory.SharedMemory] = None
+
+
+def _attach_shared_numbers(shm_name: str, length: int) -> None:
+    """
+    Attach this worker to the shared input array (pool initializer).
+
+    Args:
+        shm_name: Name of the shared memory block.
+        length: Number of int64 elements in the block.
+    """
+    global _shm_numbers, _shm_handle
+    _shm_handle = shared_memory.SharedMemory(name=shm_name)
+    _shm_numbers = np.ndarray((length,), dtype=np.int64, buffer=_shm_handle.buf)
+
+
+def _primes_in_slice(bounds: Tuple[int, int]) -> List[int]:
+    """
+    Find primes in a slice of the attached shared input array.
+
+    Args:
+        bounds: (start, end) indices into the shared array.
+
+    Returns:
+        List of primes found in the slice.
+    """
+    start, end = bounds
+    return [int(n) for n in _shm_numbers[start:end] if _is_prime(int(n))[1]]
+
+
+def _sieve_primes(lo: int, hi: int) -> List[int]:
+    """
+    Find primes in [lo, hi] with a NumPy sieve of Eratosthenes.
+
+    For a known contiguous range one vectorized sieve beats
+    parallelizing per-number trial division by orders of magnitude: the
+    crossing-off runs as strided slice assignments in C.
+
+    Args:
+        lo: Inclusive lower bound.
+        hi: Inclusive upper bound.
+
+    Returns:
+        List of primes in the range.
+    """
+    sieve = np.ones(hi + 1, dtype=bool)
+    sieve[:2] = False
+    for i in range(2, math.isqrt(hi) + 1):
+        if sieve[i]:
+            sieve[i * i::i] = False
+    return (np.flatnonzero(sieve[lo:hi + 1]) + lo).tolist()
+
+
+def _io_task(task_id: int) -> Tuple[int, float]:
+    """
+    Simulate an I/O-bound task.
+
+    Args:
+        task_id: Task identifier.
+
+    Returns:
+        Tuple containing (task_id, elapsed_time).
+    """
+    print(f"Task {task_id} starting (PID: {os.getpid()})")
+
+    start_time = time.time()
+
+    # Simulate I/O operations (e.g., network requests, file operations)
+    time.sleep(random.uniform(0.5, 1.0))
+
+    end_time = time.time()
+    elapsed = end_time - start_time
+
+    print(f"Task {task_id} completed in {elapsed:.2f} seconds")
+
+    return (task_id, elapsed)
+
+
+# Per-process state seeded by the pool initializer
+_process_data: Dict[str, Any] = {}
+
+
+def _init_process(init_value: int) -> None:
+    """
+    Initialize process-specific data.
+
+    Args:
+        init_value: Initial value for the process data.
+    """
+    global _process_data
+
+    # Initialize process-specific data
+    pid = os.getpid()
+    _process_data = {
+        'pid': pid,
+        'value': init_value,
+        'start_time': time.time()
+    }
+
+    print(f"Process {pid} initialized with value {init_value}")
+
+
+def _initialized_worker(x: int) -> Tuple[int, Dict[str, Any]]:
+    """
+    Worker function that uses the initialized data.
+
+    Args:
+        x: Input value.
+
+    Returns:
+        Tuple containing (input value, process data).
+    """
+    # Update the process data
+    _process_data['value'] += x
+    _process_data['last_input'] = x
+    _process_data['elapsed'] = time.time() - _process_data['start_time']
+
+    # Deterministic CPU-bound work in place of a simulated delay
+    _spin(x)
+
+    return (x, _process_data.copy())
+
+
+def basic_pool_example(pool: Optional[mp.pool.Pool] = None) -> None:
     """Demonstrate basic usage of a process pool."""
     print("\n=== Basic Process Pool Example ===")
     
-    def worker_function(x: int) -> Tuple[int, int, float]:
-        """
-        A worker function that performs a computation.
-        
-        Args:
-            x: Input value.
-            
-        Returns:
-            Tuple containing (input value, process ID, result).
-        """
-        # Simulate some computation
-        result = x * x
-        
-        # Simulate variable processing time
-        time.sleep(random.uniform(0.1, 0.5))
-        
-        return (x, os.getpid(), result)
-    
-    # Create a pool of worker processes
-    num_processes = min(4, mp.cpu_count())
-    print(f"Creating a pool with {num_processes} processes")
-    
-    with mp.Pool(processes=num_processes) as pool:
+    with _pool_cm(pool) as pool:
         # Submit tasks to the pool
         inputs = list(range(1, 11))
         
         # Map the worker function to the inputs
-        results = pool.map(worker_function, inputs)
+        results = pool.map(_square_worker, inputs)
         
         # Print the results
         print("\nResults:")
         for x, pid, result in results:
             print(f"Input: {x}, Process: {pid}, Result: {result}")
+        
+        # When task costs vary widely, static map batches can strand
+        # work behind a straggler; dynamic one-at-a-time dispatch keeps
+        # every worker busy until the queue is empty
+        print("\nResults with dynamic dispatch (completion order):")
+        for x, pid, result in _dynamic_map(pool, _square_worker, inputs):
+            print(f"Input: {x}, Process: {pid}, Result: {result}")
 
 
-def pool_map_async_example() -> None:
+def pool_map_async_example(pool: Optional[mp.pool.Pool] = None) -> None:
     """Demonstrate asynchronous mapping with a process pool."""
     print("\n=== Process Pool Map Async Example ===")
     
-    def worker_function(x: int) -> Tuple[int, int, float]:
-        """
-        A worker function that performs a computation.
-        
-        Args:
-            x: Input value.
-            
-        Returns:
-            Tuple containing (input value, process ID, result).
-        """
-        # Simulate some computation
-        result = x * x * x
-        
-        # Simulate variable processing time
-        time.sleep(random.uniform(0.1, 0.3))
-        
-        return (x, os.getpid(), result)
-    
-    # Create a pool of worker processes
-    num_processes = min(4, mp.cpu_count())
-    
-    with mp.Pool(processes=num_processes) as pool:
+    with _pool_cm(pool) as pool:
         # Submit tasks to the pool asynchronously
         inputs = list(range(1, 11))
         
         # Map the worker function to the inputs asynchronously
-        result_async = pool.map_async(worker_function, inputs)
+        result_async = pool.map_async(_cube_worker, inputs)
         
         # Do some other work while the tasks are being processed
         print("Tasks submitted asynchronously, doing other work...")
@@ -101,50 +413,51 @@ def pool_map_async_example() -> None:
             print(f"Input: {x}, Process: {pid}, Result: {result}")
 
 
-def pool_apply_example() -> None:
+def pool_apply_example(pool: Optional[mp.pool.Pool] = None) -> None:
     """Demonstrate apply and apply_async with a process pool."""
     print("\n=== Process Pool Apply Example ===")
     
-    def worker_function(x: int, y: int) -> Tuple[int, int, int, float]:
-        """
-        A worker function that performs a computation with multiple arguments.
-        
-        Args:
-            x: First input value.
-            y: Second input value.
-            
-        Returns:
-            Tuple containing (first input, second input, process ID, result).
-        """
-        # Simulate some computation
-        result = x ** y
-        
-        # Simulate variable processing time
-        time.sleep(random.uniform(0.1, 0.5))
-        
-        return (x, y, os.getpid(), result)
-    
-    # Create a pool of worker processes
-    num_processes = min(4, mp.cpu_count())
-    
-    with mp.Pool(processes=num_processes) as pool:
-        # Use apply (blocking)
+    # The blocking section uses its own pool whose initializer ships
+    # the constant exponent once per worker; each apply then pickles
+    # only the varying argument. With a large read-only payload this
+    # saves one copy per task.
+    with mp.Pool(
+        processes=_NPROC,
+        initializer=_set_const,
+        initargs=(2,)
+    ) as const_pool:
+        # Use apply (blocking). SLOW: apply blocks until its one task
+        # returns, so this loop fully serializes the "parallel" work —
+        # only one worker is ever busy at a time.
         print("\nUsing apply (blocking):")
         start_time = time.time()
         
         results = []
         for i in range(1, 6):
-            result = pool.apply(worker_function, args=(i, 2))
+            result = const_pool.apply(_pow_const, args=(i,))
             results.append(result)
         
-        end_time = time.time()
-        print(f"Apply completed in {end_time - start_time:.2f} seconds")
+        apply_time = time.time() - start_time
+        print(f"Apply completed in {apply_time:.2f} seconds")
         
         # Print the results
         print("\nResults from apply:")
         for x, y, pid, result in results:
             print(f"Input: ({x}, {y}), Process: {pid}, Result: {result}")
         
+        # The same work through pool.map hands every task out at once,
+        # so all workers run in parallel and the loop above's cost
+        # shrinks by roughly the worker count
+        print("\nSame work with pool.map:")
+        start_time = time.time()
+        results = const_pool.map(_pow_const, range(1, 6))
+        map_time = time.time() - start_time
+        print(f"Map completed in {map_time:.2f} seconds "
+              f"({apply_time / max(map_time, 1e-9):.1f}x faster than apply)")
+        for x, y, pid, result in results:
+            print(f"Input: ({x}, {y}), Process: {pid}, Result: {result}")
+    
+    with _pool_cm(pool) as pool:
         # Use apply_async (non-blocking)
         print("\nUsing apply_async (non-blocking):")
         start_time = time.time()
@@ -152,14 +465,19 @@ def pool_apply_example() -> None:
         # Submit tasks asynchronously
         async_results = []
         for i in range(1, 6):
-            async_result = pool.apply_async(worker_function, args=(i, 3))
+            async_result = pool.apply_async(_pow_worker, args=(i, 3))
             async_results.append(async_result)
         
         # Do some other work
         print("Tasks submitted asynchronously, doing other work...")
         time.sleep(0.5)
         
-        # Get the results
+        # Serial .get() calls each take the result's condition lock and
+        # block in submission order, so one slow early task holds up
+        # collection of faster later ones. Poll ready() (a lock-free
+        # check) until everything is done, then get() is near-free.
+        while not all(async_result.ready() for async_result in async_results):
+            time.sleep(0.01)
         results = [async_result.get() for async_result in async_results]
         
         end_time = time.time()
@@ -171,38 +489,16 @@ def pool_apply_example() -> None:
             print(f"Input: ({x}, {y}), Process: {pid}, Result: {result}")
 
 
-def pool_starmap_example() -> None:
+def pool_starmap_example(pool: Optional[mp.pool.Pool] = None) -> None:
     """Demonstrate starmap with a process pool."""
     print("\n=== Process Pool Starmap Example ===")
     
-    def worker_function(x: int, y: int) -> Tuple[int, int, int, float]:
-        """
-        A worker function that performs a computation with multiple arguments.
-        
-        Args:
-            x: First input value.
-            y: Second input value.
-            
-        Returns:
-            Tuple containing (first input, second input, process ID, result).
-        """
-        # Simulate some computation
-        result = x ** y
-        
-        # Simulate variable processing time
-        time.sleep(random.uniform(0.1, 0.3))
-        
-        return (x, y, os.getpid(), result)
-    
-    # Create a pool of worker processes
-    num_processes = min(4, mp.cpu_count())
-    
-    with mp.Pool(processes=num_processes) as pool:
-        # Create a list of argument tuples
-        args_list = [(i, j) for i in range(1, 4) for j in range(1, 4)]
-        
-        # Use starmap to map the function to multiple arguments
-        results = pool.starmap(worker_function, args_list)
+    with _pool_cm(pool) as pool:
+        # Feed starmap an iterator instead of a materialized list: with a
+        # chunksize it pulls arguments lazily, so peak memory stays at
+        # O(chunksize * workers) even when the cross-product is large
+        args_iter = itertools.product(range(1, 4), range(1, 4))
+        results = pool.starmap(_pow_worker, args_iter, chunksize=4)
         
         # Print the results
         print("\nResults from starmap:")
@@ -212,8 +508,11 @@ def pool_starmap_example() -> None:
         # Use starmap_async
         print("\nUsing starmap_async:")
         
-        # Submit tasks asynchronously
-        async_result = pool.starmap_async(worker_function, args_list)
+        # Submit tasks asynchronously. Note starmap_async consumes the
+        # iterator eagerly up front; for very large inputs, prefer imap
+        # over a wrapper function to keep the feed lazy.
+        args_iter = itertools.product(range(1, 4), range(1, 4))
+        async_result = pool.starmap_async(_pow_worker, args_iter, chunksize=4)
         
         # Do some other work
         print("Tasks submitted asynchronously, doing other work...")
@@ -226,30 +525,39 @@ def pool_starmap_example() -> None:
         print("\nResults from starmap_async:")
         for x, y, pid, result in results:
             print(f"Input: ({x}, {y}), Process: {pid}, Result: {result}")
+        
+        # Chunk-packed payloads: send one task per batch of pairs and
+        # let the worker loop over them. starmap's chunksize batches the
+        # dispatch but still makes one function call per pair; packing
+        # the batch into the payload amortizes the call overhead too.
+        # Real workloads want batches of ~64; the demo uses 4 so more
+        # than one batch exists to hand out.
+        print("\nUsing chunk-packed batches:")
+        pairs = iter(itertools.product(range(1, 4), range(1, 4)))
+        chunks = iter(lambda: list(itertools.islice(pairs, 4)), [])
+        results_lists = pool.map(_pow_batch, chunks)
+        results = [r for rl in results_lists for r in rl]
+        for x, y, pid, result in results:
+            print(f"Input: ({x}, {y}), Process: {pid}, Result: {result}")
 
 
-def pool_callback_example() -> None:
+def pool_callback_example(pool: Optional[mp.pool.Pool] = None) -> None:
     """Demonstrate callbacks with a process pool."""
     print("\n=== Process Pool Callback Example ===")
     
-    def worker_function(x: int) -> Tuple[int, int, float]:
-        """
-        A worker function that performs a computation.
-        
-        Args:
-            x: Input value.
-            
-        Returns:
-            Tuple containing (input value, process ID, result).
-        """
-        # Simulate some computation
-        result = x * x
-        
-        # Simulate variable processing time
-        time.sleep(random.uniform(0.1, 0.5))
-        
-        return (x, os.getpid(), result)
-    
+    # Callbacks run on the pool's single result-handler thread, so an
+    # expensive callback (even print, which can block on stdout) stalls
+    # delivery of every other task's result. Keep the callbacks to a
+    # bare queue.put and do the printing on our own daemon thread.
+    cb_q: "queue.Queue[str]" = queue.Queue()
+
+    def _cb_worker(q: "queue.Queue[str]") -> None:
+        """Drain callback messages and print them off the handler thread."""
+        while True:
+            print(q.get())
+
+    threading.Thread(target=_cb_worker, args=(cb_q,), daemon=True).start()
+
     def success_callback(result: Tuple[int, int, float]) -> None:
         """
         Callback function for successful task completion.
@@ -258,7 +566,7 @@ def pool_callback_example() -> None:
             result: Result from the worker function.
         """
         x, pid, value = result
-        print(f"Success callback: Input {x}, Process {pid}, Result {value}")
+        cb_q.put(f"Success callback: Input {x}, Process {pid}, Result {value}")
     
     def error_callback(error: Exception) -> None:
         """
@@ -267,120 +575,78 @@ def pool_callback_example() -> None:
         Args:
             error: Exception raised by the worker function.
         """
-        print(f"Error callback: {error}")
-    
-    # Create a pool of worker processes
-    num_processes = min(4, mp.cpu_count())
+        cb_q.put(f"Error callback: {error}")
     
-    with mp.Pool(processes=num_processes) as pool:
-        # Submit tasks with callbacks
+    with _pool_cm(pool) as pool:
+        # Submit tasks with callbacks, keeping the AsyncResult handles
+        async_results = []
         for i in range(1, 6):
-            pool.apply_async(
-                worker_function, 
+            async_results.append(pool.apply_async(
+                _square_worker, 
                 args=(i,), 
                 callback=success_callback,
                 error_callback=error_callback
-            )
-        
-        # Submit a task that will raise an error
-        def error_function(x: int) -> int:
-            """Function that raises an error."""
-            time.sleep(0.2)
-            raise ValueError(f"Deliberate error for input {x}")
+            ))
         
-        pool.apply_async(
-            error_function, 
+        async_results.append(pool.apply_async(
+            _error_worker, 
             args=(10,), 
             callback=success_callback,
             error_callback=error_callback
-        )
+        ))
         
-        # Wait for all tasks to complete
-        # Note: We need to explicitly wait since we're using callbacks
+        # Wait until every task has completed: ready() is a lock-free
+        # event check, unlike a blind sleep (slow) or get() (takes the
+        # result lock and raises for the error task)
         print("Waiting for all tasks to complete...")
-        time.sleep(2)
+        while not all(result.ready() for result in async_results):
+            time.sleep(0.05)
+        # Let the printer thread drain before the next example starts
+        while not cb_q.empty():
+            time.sleep(0.01)
 
 
 def process_pool_executor_example() -> None:
     """Demonstrate the concurrent.futures.ProcessPoolExecutor."""
     print("\n=== ProcessPoolExecutor Example ===")
     
-    def worker_function(x: int) -> Tuple[int, int, float]:
-        """
-        A worker function that performs a computation.
-        
-        Args:
-            x: Input value.
-            
-        Returns:
-            Tuple containing (input value, process ID, result).
-        """
-        # Simulate some computation
-        result = x * x
-        
-        # Simulate variable processing time
-        time.sleep(random.uniform(0.1, 0.3))
-        
-        return (x, os.getpid(), result)
-    
     # Create a process pool executor
-    num_processes = min(4, mp.cpu_count())
+    num_processes = _NPROC
     
     with ProcessPoolExecutor(max_workers=num_processes) as executor:
-        # Submit tasks to the executor
-        futures = [executor.submit(worker_function, i) for i in range(1, 11)]
-        
-        # Process results as they complete
-        from concurrent.futures import as_completed
-        
-        print("\nProcessing results as they complete:")
-        for future in as_completed(futures):
-            try:
-                x, pid, result = future.result()
-                print(f"Input: {x}, Process: {pid}, Result: {result}")
-            except Exception as e:
-                print(f"Task generated an exception: {e}")
+        # executor.map with a chunksize batches inputs over the single
+        # task queue: one pickled message per 3 inputs instead of a
+        # Future (and a waiter wakeup in as_completed) per task, which
+        # is what keeps the dispatch path cheap as task counts grow
+        print("\nProcessing results with executor.map (chunksize=3):")
+        for x, pid, result in executor.map(_square_worker, range(1, 11), chunksize=3):
+            print(f"Input: {x}, Process: {pid}, Result: {result}")
         
         # Use map
         print("\nUsing executor.map:")
-        results = list(executor.map(worker_function, range(1, 6)))
+        results = list(executor.map(_square_worker, range(1, 6)))
         
         for x, pid, result in results:
             print(f"Input: {x}, Process: {pid}, Result: {result}")
+        
+        # When results are needed in completion order, a wait() loop
+        # over a pending set wakes up once per batch of completions;
+        # as_completed registers a done callback per future and signals
+        # through a lock per result, which adds up when futures far
+        # outnumber workers
+        print("\nProcessing results in completion order with wait():")
+        pending = {executor.submit(_cube_worker, i) for i in range(1, 11)}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                x, pid, result = future.result()
+                print(f"Input: {x}, Process: {pid}, Result: {result}")
 
 
-def cpu_bound_task_example() -> None:
+def cpu_bound_task_example(pool: Optional[mp.pool.Pool] = None) -> None:
     """Demonstrate process pools for CPU-bound tasks."""
     print("\n=== CPU-Bound Task Example ===")
     
-    def is_prime(n: int) -> Tuple[int, bool]:
-        """
-        Check if a number is prime.
-        
-        Args:
-            n: Number to check.
-            
-        Returns:
-            Tuple containing (number, is_prime).
-        """
-        if n <= 1:
-            return (n, False)
-        if n <= 3:
-            return (n, True)
-        if n % 2 == 0 or n % 3 == 0:
-            return (n, False)
-        
-        i = 5
-        while i * i <= n:
-            if n % i == 0 or n % (i + 2) == 0:
-                return (n, False)
-            i += 6
-        
-        # Simulate more intensive computation
-        time.sleep(0.01)
-        
-        return (n, True)
-    
     # Generate a list of numbers to check
     numbers = list(range(1000, 2000))
     
@@ -388,7 +654,7 @@ def cpu_bound_task_example() -> None:
     print("\nSequential execution:")
     start_time = time.time()
     
-    sequential_results = [is_prime(n) for n in numbers]
+    sequential_results = [_is_prime(n) for n in numbers]
     sequential_primes = [n for n, is_prime_flag in sequential_results if is_prime_flag]
     
     end_time = time.time()
@@ -400,10 +666,26 @@ def cpu_bound_task_example() -> None:
     print("\nParallel execution with process pool:")
     start_time = time.time()
     
-    with mp.Pool() as pool:
-        parallel_results = pool.map(is_prime, numbers)
-    
-    parallel_primes = [n for n, is_prime_flag in parallel_results if is_prime_flag]
+    with _pool_cm(pool) as pool:
+        # An explicit chunksize batches the 1000 checks into a few dozen
+        # pickled messages instead of relying on map's tiny auto value;
+        # a handful of chunks per worker still leaves room to balance
+        num_processes = _NPROC
+        chunksize = max(1, len(numbers) // (num_processes * 4))
+        # Dispatch the biggest numbers first: trial division cost grows
+        # with n, so starting the longest jobs early keeps the cheap
+        # tail available to whichever worker frees up last. (For truly
+        # unknown costs, chunksize=1 with imap_unordered approximates
+        # dynamic work stealing.)
+        ordered = sorted(numbers, reverse=True)
+        # imap_unordered streams results as chunks finish: primes are
+        # filtered on the fly (no intermediate results list) and a fast
+        # worker never idles waiting for an earlier, slower chunk
+        parallel_primes = [
+            n for n, is_prime_flag
+            in pool.imap_unordered(_is_prime, ordered, chunksize=chunksize)
+            if is_prime_flag
+        ]
     
     end_time = time.time()
     parallel_time = end_time - start_time
@@ -413,36 +695,59 @@ def cpu_bound_task_example() -> None:
     # Calculate speedup
     speedup = sequential_time / parallel_time
     print(f"Speedup: {speedup:.2f}x")
+    
+    # Parallel execution with shared-memory inputs: the numbers live in
+    # one SharedMemory block that workers attach to at startup, so each
+    # task ships two integers of bounds instead of a pickled chunk of
+    # inputs — per-task IPC stops scaling with the data size
+    print("\nParallel execution with shared-memory inputs:")
+    start_time = time.time()
+    
+    arr = np.asarray(numbers, dtype=np.int64)
+    shm = shared_memory.SharedMemory(create=True, size=arr.nbytes)
+    try:
+        shared_arr = np.ndarray(arr.shape, dtype=arr.dtype, buffer=shm.buf)
+        shared_arr[:] = arr
+        
+        num_processes = _NPROC
+        step = max(1, len(arr) // (num_processes * 4))
+        bounds = [(i, min(i + step, len(arr))) for i in range(0, len(arr), step)]
+        
+        with mp.Pool(
+            processes=num_processes,
+            initializer=_attach_shared_numbers,
+            initargs=(shm.name, len(arr))
+        ) as shm_pool:
+            shm_primes = [
+                n for found in shm_pool.imap_unordered(_primes_in_slice, bounds)
+                for n in found
+            ]
+    finally:
+        shm.close()
+        shm.unlink()
+    
+    end_time = time.time()
+    print(f"Shared-memory execution time: {end_time - start_time:.2f} seconds")
+    print(f"Found {len(shm_primes)} prime numbers")
+    
+    # Vectorized execution: for a contiguous range, a single NumPy sieve
+    # outruns both of the above — parallelism is not the only (or best)
+    # tool for every CPU-bound problem
+    print("\nVectorized execution with a NumPy sieve:")
+    start_time = time.time()
+    
+    sieve_primes = _sieve_primes(numbers[0], numbers[-1])
+    
+    end_time = time.time()
+    sieve_time = end_time - start_time
+    print(f"Sieve execution time: {sieve_time:.4f} seconds")
+    print(f"Found {len(sieve_primes)} prime numbers")
 
 
 def io_bound_task_example() -> None:
-    """Demonstrate process pools for I/O-bound tasks."""
+    """Demonstrate that I/O-bound tasks want threads, not processes."""
     print("\n=== I/O-Bound Task Example ===")
     
-    def io_task(task_id: int) -> Tuple[int, float]:
-        """
-        Simulate an I/O-bound task.
-        
-        Args:
-            task_id: Task identifier.
-            
-        Returns:
-            Tuple containing (task_id, elapsed_time).
-        """
-        print(f"Task {task_id} starting (PID: {os.getpid()})")
-        
-        start_time = time.time()
-        
-        # Simulate I/O operations (e.g., network requests, file operations)
-        time.sleep(random.uniform(0.5, 1.0))
-        
-        end_time = time.time()
-        elapsed = end_time - start_time
-        
-        print(f"Task {task_id} completed in {elapsed:.2f} seconds")
-        
-        return (task_id, elapsed)
-    
     # Number of tasks
     num_tasks = 20
     
@@ -450,18 +755,21 @@ def io_bound_task_example() -> None:
     print("\nSequential execution:")
     start_time = time.time()
     
-    sequential_results = [io_task(i) for i in range(num_tasks)]
+    sequential_results = [_io_task(i) for i in range(num_tasks)]
     
     end_time = time.time()
     sequential_time = end_time - start_time
     print(f"Sequential execution time: {sequential_time:.2f} seconds")
     
-    # Parallel execution with process pool
-    print("\nParallel execution with process pool:")
+    # Parallel execution with a thread pool: these tasks only wait, and
+    # sleeping (like real network or disk I/O) releases the GIL, so
+    # threads overlap them fully without fork/spawn cost or pickling.
+    # Process pools earn their overhead on CPU-bound work, not here.
+    print("\nParallel execution with a thread pool:")
     start_time = time.time()
     
-    with mp.Pool() as pool:
-        parallel_results = pool.map(io_task, range(num_tasks))
+    with ThreadPoolExecutor(max_workers=min(32, num_tasks)) as executor:
+        parallel_results = list(executor.map(_io_task, range(num_tasks)))
     
     end_time = time.time()
     parallel_time = end_time - start_time
@@ -476,60 +784,14 @@ def pool_initializer_example() -> None:
     """Demonstrate using an initializer function with a process pool."""
     print("\n=== Process Pool Initializer Example ===")
     
-    # Global variables to be initialized in each process
-    process_data = {}
-    
-    def initializer(init_value: int) -> None:
-        """
-        Initialize process-specific data.
-        
-        Args:
-            init_value: Initial value for the process data.
-        """
-        # Use the global variable
-        global process_data
-        
-        # Initialize process-specific data
-        pid = os.getpid()
-        process_data = {
-            'pid': pid,
-            'value': init_value,
-            'start_time': time.time()
-        }
-        
-        print(f"Process {pid} initialized with value {init_value}")
-    
-    def worker_function(x: int) -> Tuple[int, Dict[str, Any]]:
-        """
-        Worker function that uses the initialized data.
-        
-        Args:
-            x: Input value.
-            
-        Returns:
-            Tuple containing (input value, process data).
-        """
-        # Access the global variable
-        global process_data
-        
-        # Update the process data
-        process_data['value'] += x
-        process_data['last_input'] = x
-        process_data['elapsed'] = time.time() - process_data['start_time']
-        
-        # Simulate some work
-        time.sleep(random.uniform(0.1, 0.3))
-        
-        return (x, process_data.copy())
-    
     # Create a pool with an initializer
     with mp.Pool(
         processes=4, 
-        initializer=initializer, 
+        initializer=_init_process, 
         initargs=(100,)
     ) as pool:
         # Submit tasks to the pool
-        results = pool.map(worker_function, range(1, 11))
+        results = pool.map(_initialized_worker, range(1, 11))
         
         # Print the results
         print("\nResults:")
@@ -541,14 +803,32 @@ def run_demo() -> None:
     """Run all process pool examples."""
     print("=== Process Pool Examples ===")
     
-    basic_pool_example()
-    pool_map_async_example()
-    pool_apply_example()
-    pool_starmap_example()
-    pool_callback_example()
-    process_pool_executor_example()
-    cpu_bound_task_example()
-    io_bound_task_example()
+    # One persistent pool serves every example that does not need its
+    # own initializer, so process startup is paid once instead of per
+    # demo
+    num_processes = _NPROC
+    print(f"Creating a shared pool with {num_processes} processes")
+    
+    # Spawn instead of the Linux fork default: forked children copy the
+    # parent's heap copy-on-write, and the first refcount update on a
+    # shared object dirties its whole page, so memory use balloons with
+    # worker count. Spawn starts clean interpreters and also behaves the
+    # same on every platform.
+    ctx = mp.get_context("spawn")
+    with ctx.Pool(processes=num_processes) as pool:
+        # Warm up: one no-op per worker so interpreter boot and module
+        # import are paid here, not inside the first timed section
+        pool.map(_noop, range(num_processes))
+        basic_pool_example(pool)
+        pool_map_async_example(pool)
+        pool_apply_example(pool)
+        pool_starmap_example(pool)
+        pool_callback_example(pool)
+        process_pool_executor_example()
+        cpu_bound_task_example(pool)
+        io_bound_task_example()
+    
+    # Needs its own pool: the initializer seeds per-process state
     pool_initializer_example()
     
     print("\nAll process pool examples completed")
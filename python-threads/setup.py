@@ -2,7 +2,42 @@
 Setup script for the python-threads package.
 """
 
-from setuptools import setup, find_packages
+from setuptools import setup, find_packages, Extension
+
+# Compile the Cython prime kernel when Cython is installed; the package
+# stays importable without it thanks to the pure-Python fallback in
+# comparison/cpu_bound_comparison.py
+try:
+    from Cython.Build import cythonize
+    ext_modules = cythonize(
+        "comparison/primes.pyx",
+        language_level=3,
+        compiler_directives={
+            "boundscheck": False,
+            "wraparound": False,
+            "cdivision": True,
+        },
+    )
+except ImportError:
+    ext_modules = []
+
+# Plain-C extension: the lock-free counter helpers need only a C
+# compiler, not Cython. It relies on the GCC/Clang __atomic builtins,
+# so it will not compile under MSVC or without a toolchain.
+ext_modules.append(
+    Extension(
+        "multiprocessing_examples._atomics",
+        sources=["multiprocessing_examples/_atomics.c"],
+    )
+)
+
+# Every extension here is an accelerator with a pure-Python fallback
+# (cpu_bound_comparison and shared_memory degrade via try/ImportError),
+# so a failed compile should skip the extension rather than abort the
+# install — the package must stay pip-installable on machines with no
+# C compiler, as the baseline pure-Python setup was.
+for ext in ext_modules:
+    ext.optional = True
 
 setup(
     name="python-threads",
@@ -11,6 +46,7 @@ setup(
     author="Your Name",
     author_email="your.email@example.com",
     packages=find_packages(),
+    ext_modules=ext_modules,
     install_requires=[
         "numpy",
         "pandas",